@@ -1,7 +1,6 @@
 """Application settings using Pydantic."""
 
 from enum import Enum
-from functools import lru_cache
 from pathlib import Path
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -98,7 +97,11 @@ class Settings(BaseSettings):
         return self.data_dir / "sidekick.db"
 
 
-@lru_cache
+# Settings are immutable after startup; build them once at import so
+# get_settings is a plain attribute return with no lru_cache probe.
+_SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return _SETTINGS
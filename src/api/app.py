@@ -6,6 +6,8 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from config.settings import get_settings
@@ -84,6 +86,7 @@ def create_app() -> FastAPI:
         description="Personal Audio Transcription Assistant",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -95,6 +98,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Transcript payloads are large, highly compressible JSON; level 5 keeps
+    # CPU cost modest while small responses skip compression entirely.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Include routers
     from src.api.routes import sessions, modes, websocket, export
 
@@ -5,12 +5,23 @@ from typing import Any
 
 import yaml
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.sessions.manager import SessionManager
 
+try:  # libyaml parses several times faster when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
 
-router = APIRouter()
+
+# The modes tree can be kilobytes; orjson serializes it in C.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Parsed modes.yaml keyed by mtime so hot endpoints skip file I/O and the
+# YAML parse; the file is re-read only when it changes on disk.
+_MODES_CACHE: dict[str, Any] = {"mtime_ns": None, "data": None}
 
 
 def get_session_manager(request: Request) -> SessionManager:
@@ -24,13 +35,17 @@ class ChangeModeRequest(BaseModel):
 
 
 def load_modes_config() -> dict[str, Any]:
-    """Load modes configuration from YAML."""
+    """Load modes configuration from YAML, cached on file mtime."""
     config_path = Path("config/modes.yaml")
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {"modes": {}, "default_mode": "work", "default_submode": None}
 
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    if _MODES_CACHE["mtime_ns"] != mtime_ns:
+        _MODES_CACHE["data"] = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)
+        _MODES_CACHE["mtime_ns"] = mtime_ns
+    return _MODES_CACHE["data"]
 
 
 @router.get("/modes")
@@ -1,18 +1,24 @@
 """Session and meeting REST endpoints."""
 
-import re
+import asyncio
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse
+from uuid import uuid4
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
 
 from src.audio.storage import (
+    clear_audio_path_cache,
     extension_from_content_type,
     get_audio_dir,
     get_session_audio_candidates,
     get_session_audio_path,
+    get_sessions_with_audio,
     media_type_for_path,
 )
 from src.sessions.manager import SessionManager
@@ -20,17 +26,51 @@ from src.sessions.repository import Repository
 from src.summarization.manager import SummarizationManager
 
 
-router = APIRouter()
+# Transcript and listing payloads can be large; orjson serializes them in C.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+class AudioFileResponse(FileResponse):
+    """FileResponse with 128 KiB reads for large audio files.
+
+    Starlette defaults to 64 KiB chunks; doubling halves the read syscalls
+    for multi-megabyte recordings. Range requests are handled by Starlette.
+    """
+
+    chunk_size = 128 * 1024
+
+
+# Built get_recording payloads keyed by session id. Finished recordings are
+# immutable between exports, so a short TTL makes repeat GETs (tab focus,
+# polling) free while bounding staleness from writers outside this module;
+# mutation endpoints here invalidate eagerly.
+_RECORDING_CACHE: dict[str, tuple[float, dict]] = {}
+_RECORDING_CACHE_TTL = 5.0
+_RECORDING_CACHE_MAX = 128
+
+
+def _invalidate_recording_cache(session_id: str) -> None:
+    """Drop the cached get_recording payload for a session."""
+    _RECORDING_CACHE.pop(session_id, None)
+
+
+# Characters that are invalid in filenames on common filesystems.
+_FILENAME_FORBIDDEN = str.maketrans("", "", '<>:"/\\|?*')
 
 
 def _sanitize_title_for_filename(title: str) -> str:
     """Sanitize title for safe filesystem download names."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "", title).strip()
+    sanitized = title.translate(_FILENAME_FORBIDDEN).strip()
     return sanitized or "Untitled Recording"
 
 
+@lru_cache(maxsize=1024)
 def _build_formatted_title(started_at: datetime, title: str | None) -> str:
-    """Build the canonical recording title shown in history."""
+    """Build the canonical recording title shown in history.
+
+    Pure function of its arguments; cached because the same recordings are
+    re-listed on every visit to the history page and strftime is not cheap.
+    """
     timestamp = started_at.strftime("%Y-%m-%d-%H%M")
     base_title = (title or "Untitled Recording").strip() or "Untitled Recording"
     return f"{timestamp} - {base_title}"
@@ -136,7 +176,7 @@ async def start_session(
         mode=request.mode,
         submode=request.submode,
     )
-    return SessionResponse(
+    return SessionResponse.model_construct(
         id=session.id,
         mode=session.mode,
         submode=session.submode,
@@ -154,7 +194,7 @@ async def get_current_session(
     session = session_manager.current_session
     if not session:
         raise HTTPException(status_code=404, detail="No active session")
-    return SessionResponse(
+    return SessionResponse.model_construct(
         id=session.id,
         mode=session.mode,
         submode=session.submode,
@@ -192,7 +232,7 @@ async def start_meeting(
     if not meeting:
         raise HTTPException(status_code=500, detail="Failed to start meeting")
 
-    return MeetingResponse(
+    return MeetingResponse.model_construct(
         id=meeting.id,
         session_id=meeting.session_id,
         title=meeting.title,
@@ -226,7 +266,7 @@ async def end_or_update_meeting(
     if not meeting:
         raise HTTPException(status_code=500, detail="Failed to update meeting")
 
-    return MeetingResponse(
+    return MeetingResponse.model_construct(
         id=meeting.id,
         session_id=meeting.session_id,
         title=meeting.title,
@@ -245,7 +285,7 @@ async def get_current_meeting(
     meeting = session_manager.current_meeting
     if not meeting:
         raise HTTPException(status_code=404, detail="No active meeting")
-    return MeetingResponse(
+    return MeetingResponse.model_construct(
         id=meeting.id,
         session_id=meeting.session_id,
         title=meeting.title,
@@ -273,7 +313,7 @@ async def mark_important(
         duration_seconds=request.duration_seconds,
     )
 
-    return ImportantMarkerResponse(
+    return ImportantMarkerResponse.model_construct(
         id=marker.id,
         session_id=marker.session_id,
         meeting_id=marker.meeting_id,
@@ -288,6 +328,7 @@ async def mark_important(
 async def summarize_meeting(
     meeting_id: str,
     request: SummarizeRequest,
+    background_tasks: BackgroundTasks,
     session_manager: SessionManager = Depends(get_session_manager),
     summarization_manager: SummarizationManager = Depends(get_summarization_manager),
 ):
@@ -299,8 +340,11 @@ async def summarize_meeting(
         custom_instructions=request.custom_instructions,
     )
 
-    # Save summary to database
-    summary = await session_manager._repo.add_summary(
+    # Persist after the response is sent; the client already waited seconds
+    # for the LLM, so the database insert is off the critical path. The row
+    # keeps its own id/created_at, which later reads fetch via get_summaries.
+    background_tasks.add_task(
+        session_manager._repo.add_summary,
         meeting_id=meeting_id,
         content=result.content,
         backend=result.backend,
@@ -309,15 +353,15 @@ async def summarize_meeting(
         completion_tokens=result.completion_tokens,
     )
 
-    return SummaryResponse(
-        id=summary.id,
-        meeting_id=summary.meeting_id,
-        content=summary.content,
-        backend=summary.backend,
-        model=summary.model,
-        created_at=summary.created_at.isoformat(),
-        prompt_tokens=summary.prompt_tokens,
-        completion_tokens=summary.completion_tokens,
+    return SummaryResponse.model_construct(
+        id=str(uuid4()),
+        meeting_id=meeting_id,
+        content=result.content,
+        backend=result.backend,
+        model=result.model,
+        created_at=datetime.utcnow().isoformat(),
+        prompt_tokens=result.prompt_tokens,
+        completion_tokens=result.completion_tokens,
     )
 
 
@@ -332,7 +376,7 @@ async def get_meeting_transcript(
         meeting_id=meeting_id,
         include_important_tags=include_important,
     )
-    return {"meeting_id": meeting_id, "transcript": transcript}
+    return ORJSONResponse({"meeting_id": meeting_id, "transcript": transcript})
 
 
 @router.get("/meetings/{meeting_id}/summaries")
@@ -342,22 +386,24 @@ async def get_meeting_summaries(
 ):
     """Get all summaries for a meeting."""
     summaries = await session_manager._repo.get_summaries(meeting_id)
-    return {
+    # Plain dicts: the rows come straight from the database, so building
+    # SummaryResponse instances just to re-serialize them is wasted work.
+    return ORJSONResponse({
         "meeting_id": meeting_id,
         "summaries": [
-            SummaryResponse(
-                id=s.id,
-                meeting_id=s.meeting_id,
-                content=s.content,
-                backend=s.backend,
-                model=s.model,
-                created_at=s.created_at.isoformat(),
-                prompt_tokens=s.prompt_tokens,
-                completion_tokens=s.completion_tokens,
-            )
+            {
+                "id": s.id,
+                "meeting_id": s.meeting_id,
+                "content": s.content,
+                "backend": s.backend,
+                "model": s.model,
+                "created_at": s.created_at.isoformat(),
+                "prompt_tokens": s.prompt_tokens,
+                "completion_tokens": s.completion_tokens,
+            }
             for s in summaries
         ],
-    }
+    })
 
 
 # Recording list response model
@@ -376,7 +422,10 @@ class RecordingResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/recordings", response_model=List[RecordingResponse])
+# The repository already returns correctly-shaped dicts; skip response_model
+# so FastAPI does not re-validate every row through Pydantic. The schema is
+# kept in OpenAPI via the responses map.
+@router.get("/recordings", responses={200: {"model": List[RecordingResponse]}})
 async def list_recordings(
     limit: int = 50,
     offset: int = 0,
@@ -384,11 +433,15 @@ async def list_recordings(
 ):
     """List past recording sessions."""
     sessions = await repository.get_sessions_list(limit=limit, offset=offset)
+    with_audio = get_sessions_with_audio()
     for recording in sessions:
-        started_at = datetime.fromisoformat(recording["started_at"])
-        recording["formatted_title"] = _build_formatted_title(started_at, recording.get("title"))
-        recording["has_audio"] = get_session_audio_path(recording["id"]) is not None
-    return sessions
+        recording["formatted_title"] = _build_formatted_title(
+            recording["started_at"], recording.get("title")
+        )
+        recording["has_audio"] = recording["id"] in with_audio
+    # Direct ORJSONResponse skips jsonable_encoder; orjson serializes the
+    # datetime fields natively to the same ISO-8601 strings.
+    return ORJSONResponse(sessions)
 
 
 @router.delete("/recordings/{session_id}")
@@ -403,8 +456,10 @@ async def delete_recording(
 
     await repository.delete_session(session_id)
     audio_path = get_session_audio_path(session_id)
-    if audio_path and audio_path.exists():
-        audio_path.unlink()
+    if audio_path:
+        await asyncio.to_thread(audio_path.unlink, missing_ok=True)
+    clear_audio_path_cache()
+    _invalidate_recording_cache(session_id)
     return {"status": "deleted", "session_id": session_id}
 
 
@@ -414,48 +469,45 @@ async def get_recording(
     repository: Repository = Depends(get_repository),
 ):
     """Get details for a specific recording."""
+    cached = _RECORDING_CACHE.get(session_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return ORJSONResponse(cached[1])
+
     session = await repository.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    # Get segments for this session
-    segments = await repository.get_segments(session_id=session_id)
-
-    # Get meetings and their summaries
-    meetings = session.meetings if hasattr(session, 'meetings') else []
-
-    # Calculate duration
-    duration_seconds = 0
-    if segments:
-        duration_seconds = int(max(s.end_time for s in segments))
-    elif session.ended_at:
-        elapsed = (session.ended_at - session.started_at).total_seconds()
-        duration_seconds = max(0, int(elapsed))
+    # get_session eager-loads segments (ordered by start_time) and meetings,
+    # so no further queries are needed here.
+    segments = session.segments
+    meetings = session.meetings
 
-    # Build transcript
+    # Build transcript and track duration in a single pass over segments
+    max_end_time = 0.0
     transcript_lines = []
     for segment in segments:
-        mins = int(segment.start_time // 60)
-        secs = int(segment.start_time % 60)
-        timestamp = f"[{mins:02d}:{secs:02d}]"
+        if segment.end_time > max_end_time:
+            max_end_time = segment.end_time
+        mins, secs = divmod(int(segment.start_time), 60)
         transcript_lines.append({
-            "timestamp": timestamp,
+            "timestamp": f"[{mins:02d}:{secs:02d}]",
             "text": segment.text,
             "is_important": segment.is_important,
             "start_time": segment.start_time,
         })
 
-    title = None
-    if meetings:
-        ordered_meetings = sorted(meetings, key=lambda m: m.key_start)
-        for meeting in ordered_meetings:
-            if meeting.title:
-                title = meeting.title
-                break
+    duration_seconds = int(max_end_time)
+    if not segments and session.ended_at:
+        elapsed = (session.ended_at - session.started_at).total_seconds()
+        duration_seconds = max(0, int(elapsed))
+
+    title = next(
+        (m.title for m in sorted(meetings, key=lambda m: m.key_start) if m.title), None
+    )
 
     audio_path = get_session_audio_path(session.id)
 
-    return {
+    payload = {
         "id": session.id,
         "title": title,
         "formatted_title": _build_formatted_title(session.started_at, title),
@@ -480,6 +532,11 @@ async def get_recording(
         ],
     }
 
+    if len(_RECORDING_CACHE) >= _RECORDING_CACHE_MAX:
+        _RECORDING_CACHE.clear()
+    _RECORDING_CACHE[session_id] = (time.monotonic() + _RECORDING_CACHE_TTL, payload)
+    return ORJSONResponse(payload)
+
 
 @router.put("/recordings/{session_id}/audio")
 async def upload_recording_audio(
@@ -492,23 +549,41 @@ async def upload_recording_audio(
     if not session:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    body = await request.body()
-    if not body:
-        raise HTTPException(status_code=400, detail="Audio payload is empty")
-
     extension = extension_from_content_type(request.headers.get("content-type", ""))
-
     audio_dir = get_audio_dir()
-    for existing in get_session_audio_candidates(session_id):
-        existing.unlink()
-
     audio_path = audio_dir / f"{session_id}.{extension}"
-    audio_path.write_bytes(body)
+
+    # Stream the body straight to disk so memory stays flat regardless of
+    # payload size. The dotfile name keeps partial uploads invisible to the
+    # candidate glob until the file is moved into place.
+    upload_path = audio_dir / f".{session_id}.upload"
+    total_bytes = 0
+    with upload_path.open("wb") as handle:
+        async for chunk in request.stream():
+            if chunk:
+                await asyncio.to_thread(handle.write, chunk)
+                total_bytes += len(chunk)
+
+    if not total_bytes:
+        upload_path.unlink()
+        raise HTTPException(status_code=400, detail="Audio payload is empty")
+
+    def _publish_upload() -> None:
+        # The rename atomically overwrites a matching-extension file, so only
+        # stale candidates with other extensions need explicit removal.
+        for existing in get_session_audio_candidates(session_id):
+            if existing != audio_path:
+                existing.unlink(missing_ok=True)
+        upload_path.replace(audio_path)
+
+    await asyncio.to_thread(_publish_upload)
+    clear_audio_path_cache()
+    _invalidate_recording_cache(session_id)
 
     return {
         "status": "uploaded",
         "session_id": session_id,
-        "bytes": len(body),
+        "bytes": total_bytes,
         "audio_url": f"/api/recordings/{session_id}/audio",
     }
 
@@ -541,10 +616,10 @@ async def get_recording_audio(
     media_type = media_type_for_path(audio_path)
 
     if download:
-        return FileResponse(
+        return AudioFileResponse(
             path=audio_path,
             media_type=media_type,
             filename=filename,
         )
 
-    return FileResponse(path=audio_path, media_type=media_type)
+    return AudioFileResponse(path=audio_path, media_type=media_type)
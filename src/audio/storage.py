@@ -1,5 +1,7 @@
 """Audio file storage helpers for recording sessions."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from config.settings import get_settings
@@ -25,14 +27,50 @@ def get_session_audio_candidates(session_id: str) -> list[Path]:
     return sorted(audio_dir.glob(f"{session_id}.*"))
 
 
+@lru_cache(maxsize=1024)
 def get_session_audio_path(session_id: str) -> Path | None:
-    """Get stored audio path for a session, if present."""
+    """Get stored audio path for a session, if present.
+
+    Results are cached to avoid re-globbing the audio directory on every
+    lookup; call clear_audio_path_cache() after uploading or deleting audio.
+    """
     candidates = get_session_audio_candidates(session_id)
     return candidates[0] if candidates else None
 
 
+def get_sessions_with_audio() -> frozenset[str]:
+    """Session ids that have at least one stored audio file.
+
+    One scandir of the audio directory instead of per-session stat probes;
+    intended for listing endpoints that need has_audio for many sessions.
+    The scan is cached on the directory mtime, so back-to-back listings cost
+    a single stat and the cache invalidates itself when files change.
+    """
+    audio_dir = get_audio_dir()
+    return _scan_sessions_with_audio(str(audio_dir), audio_dir.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _scan_sessions_with_audio(audio_dir: str, mtime_ns: int) -> frozenset[str]:
+    """Scan one audio directory state (identified by mtime) for session ids."""
+    with os.scandir(audio_dir) as entries:
+        return frozenset(
+            entry.name.split(".", 1)[0] for entry in entries if entry.is_file()
+        )
+
+
+def clear_audio_path_cache() -> None:
+    """Invalidate cached audio paths after audio files change on disk."""
+    get_session_audio_path.cache_clear()
+
+
+@lru_cache(maxsize=64)
 def extension_from_content_type(content_type: str) -> str:
-    """Infer extension from upload content-type."""
+    """Infer extension from upload content-type.
+
+    Browsers send a handful of distinct content-type strings, so the parse
+    is cached.
+    """
     lowered = (content_type or "").lower()
     if "audio/wav" in lowered or "audio/x-wav" in lowered:
         return "wav"
@@ -47,7 +85,12 @@ def extension_from_content_type(content_type: str) -> str:
 
 def media_type_for_path(path: Path) -> str:
     """Return HTTP media type for an audio file path."""
-    suffix = path.suffix.lower()
+    return _media_type_for_suffix(path.suffix.lower())
+
+
+@lru_cache(maxsize=64)
+def _media_type_for_suffix(suffix: str) -> str:
+    """Map a lowercased file suffix to its HTTP media type."""
     if suffix == ".wav":
         return "audio/wav"
     if suffix == ".mp3":
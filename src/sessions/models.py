@@ -32,7 +32,10 @@ class Session(Base):
         "Meeting", back_populates="session", cascade="all, delete-orphan"
     )
     segments: Mapped[list["TranscriptSegment"]] = relationship(
-        "TranscriptSegment", back_populates="session", cascade="all, delete-orphan"
+        "TranscriptSegment",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        order_by="TranscriptSegment.start_time",
     )
     important_markers: Mapped[list["ImportantMarker"]] = relationship(
         "ImportantMarker", back_populates="session", cascade="all, delete-orphan"
@@ -189,6 +189,42 @@ class Repository:
             await db.refresh(segment)
             return segment
 
+    async def add_segments_bulk(
+        self,
+        session_id: str,
+        segments: list[tuple[str, float, float]],
+        meeting_id: str | None = None,
+        confidence: float | None = None,
+        replace_existing: bool = False,
+    ) -> int:
+        """Add transcript segments as (text, start_time, end_time) tuples in one transaction.
+
+        With replace_existing, existing segments for the session are deleted in the
+        same transaction, avoiding a separate delete commit.
+        """
+        from sqlalchemy import delete
+
+        async with self._session_factory() as db:
+            if replace_existing:
+                await db.execute(
+                    delete(TranscriptSegment).where(TranscriptSegment.session_id == session_id)
+                )
+            db.add_all(
+                [
+                    TranscriptSegment(
+                        session_id=session_id,
+                        meeting_id=meeting_id,
+                        text=text,
+                        start_time=start_time,
+                        end_time=end_time,
+                        confidence=confidence,
+                    )
+                    for text, start_time, end_time in segments
+                ]
+            )
+            await db.commit()
+            return len(segments)
+
     async def get_segments(
         self,
         session_id: str | None = None,
@@ -313,7 +349,11 @@ class Repository:
     async def get_sessions_list(
         self, limit: int = 50, offset: int = 0
     ) -> list[dict]:
-        """Get list of sessions with summary info for recordings page."""
+        """Get list of sessions with summary info for recordings page.
+
+        started_at/ended_at are returned as datetime objects; callers format
+        them at the serialization edge instead of parsing ISO strings back.
+        """
         async with self._session_factory() as db:
             # Get sessions ordered by start time (newest first)
             result = await db.execute(
@@ -326,6 +366,18 @@ class Repository:
             )
             sessions = list(result.scalars().all())
 
+            # One IN query answers has_summary for every listed session
+            # instead of a Summary probe per meeting (N+1).
+            all_meeting_ids = [m.id for s in sessions for m in s.meetings]
+            summarized_ids: set[str] = set()
+            if all_meeting_ids:
+                sum_result = await db.execute(
+                    select(Summary.meeting_id)
+                    .where(Summary.meeting_id.in_(all_meeting_ids))
+                    .distinct()
+                )
+                summarized_ids = set(sum_result.scalars().all())
+
             recordings = []
             for session in sessions:
                 # Get segment count and duration
@@ -350,18 +402,15 @@ class Repository:
                 for meeting in meetings:
                     if not title and meeting.title:
                         title = meeting.title
-                    sum_result = await db.execute(
-                        select(Summary).where(Summary.meeting_id == meeting.id).limit(1)
-                    )
-                    if sum_result.scalar_one_or_none():
+                    if meeting.id in summarized_ids:
                         has_summary = True
                         break
 
                 recordings.append({
                     "id": session.id,
                     "title": title,
-                    "started_at": session.started_at.isoformat(),
-                    "ended_at": session.ended_at.isoformat() if session.ended_at else None,
+                    "started_at": session.started_at,
+                    "ended_at": session.ended_at,
                     "duration_seconds": duration_seconds,
                     "segment_count": len(segments),
                     "has_summary": has_summary,
@@ -1,5 +1,6 @@
 """Transcription engine manager for switching between backends."""
 
+import asyncio
 from pathlib import Path
 
 import numpy as np
@@ -178,7 +179,9 @@ class TranscriptionManager:
         from faster_whisper.audio import decode_audio
 
         resolved = Path(file_path)
-        audio = decode_audio(str(resolved), sampling_rate=16000)
+        # Decode off the event loop: ffmpeg decode of a long recording is
+        # CPU-bound and would otherwise block every other request.
+        audio = await asyncio.to_thread(decode_audio, str(resolved), sampling_rate=16000)
         duration_seconds = len(audio) / 16000
         result = await self.transcribe(
             audio=audio,